@@ -1,51 +1,280 @@
 # HttpClient.py
 import json
+import importlib.util
+import re
 import ssl
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
-from urllib.parse import urlparse
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Any, Union
+from urllib.parse import urljoin
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.ssl_ import create_urllib3_context
-from requests.packages.urllib3.poolmanager import PoolManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class HttpClientOption:
-    """HTTP 客户端配置选项"""
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# 安装了 h2 时异步客户端启用 HTTP/2
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# 连接池配置
+POOL_CONNECTIONS = 200
+POOL_MAXSIZE = 200
+MAX_RETRIES = 3
+
+# 默认请求头（只读，多个请求共享，避免每次请求重新构建）
+JSON_HEADERS = MappingProxyType({'Content-Type': 'application/json; charset=utf-8'})
+FORM_HEADERS = MappingProxyType({
+    'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
+})
+
+# 错误信息中最多包含的响应体字节数
+ERROR_BODY_LIMIT = 1024
+
+# ijson 中表示标量值的事件
+_SCALAR_EVENTS = frozenset(('null', 'boolean', 'integer', 'double', 'number', 'string'))
 
-    def __init__(self,
-                 header: Optional[Dict[str, Any]] = None,
-                 cookie: Optional[Dict[str, Any]] = None,
-                 proxy_address: Optional[str] = None,
-                 socket_timeout: Optional[int] = None,
-                 connect_timeout: Optional[int] = None,
-                 ignore_ssl: bool = True):
+# 超过该大小（字节）的响应体按需解析（On-Demand），只物化实际访问的字段
+LAZY_JSON_THRESHOLD = 4096
+
+# 20 位及以上的连续数字可能是超出 64 位范围的整数（orjson 会将其解析为浮点数）
+_BIG_INT_RE = re.compile(rb'\d{20,}')
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    将数据序列化为 UTF-8 编码的紧凑 JSON 字节串
+
+    无论是否安装 orjson，输出都不含多余空格，保证签名内容一致
+    """
+    if orjson is not None:
+        try:
+            # 与 json.dumps 一致，允许非字符串的字典键（转换为字符串）
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson 不支持的数据（如超出 64 位范围的整数）改用标准库，输出格式相同
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# 每个线程复用一个 simdjson 解析器（解析器不是线程安全的，且复用其内部缓冲区才能发挥性能）
+_sj_local = threading.local()
+
+
+def _simdjson_parse(content: bytes) -> Any:
+    """
+    使用当前线程复用的 simdjson 解析器解析 JSON
+
+    解析器在其产生的文档仍被引用时无法复用，因此只用于在函数内即用即弃的解析，
+    不要把返回的文档交给调用方长期持有
+
+    Args:
+        content: JSON 字节串
+
+    Returns:
+        simdjson 的只读代理对象（或标量）
+
+    Raises:
+        ValueError: 非法 JSON
+        RuntimeError: simdjson 无法处理的文档（如超过 64 位的整数）
+    """
+    parser = getattr(_sj_local, 'parser', None)
+    if parser is None:
+        parser = _sj_local.parser = simdjson.Parser()
+
+    try:
+        return parser.parse(content)
+    except RuntimeError as e:
+        # 仅在复用的解析器仍被上一个文档引用时改用新的解析器，其他错误交给调用方
+        if 're-use a parser' not in str(e):
+            raise
+        return simdjson.Parser().parse(content)
+
+
+def _join(base_url: str, url: str) -> str:
+    """
+    拼接基础URL与相对路径
+
+    base_url 已保证以斜杠结尾，相对路径直接拼接即可，无需解析URL；
+    仅当 url 以 http:// 或 https:// 开头（绝对地址）时才交给 urljoin 处理，
+    查询参数中包含的URL不影响判断
+    """
+    if url.startswith(('http://', 'https://')):
+        return urljoin(base_url, url)
+    return base_url + url.lstrip('/')
+
+
+def _json_body(data: Any) -> bytes:
+    """
+    准备 JSON 请求体
+
+    Args:
+        data: 请求数据，字节串原样使用，字符串按 UTF-8 编码，其他类型序列化为 JSON
+
+    Returns:
+        JSON 请求体字节串
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return _json_dumps(data)
+
+
+def _json_loads(content: bytes) -> Any:
+    """
+    直接从字节串解析 JSON，无需先解码为文本
+
+    响应体中含有可能超出 64 位范围的整数时改用标准库解析，保证整数精确
+    """
+    if orjson is not None and not _BIG_INT_RE.search(content):
+        return orjson.loads(content)
+    return json.loads(content.decode('utf-8', errors='ignore'))
+
+
+def extract_field(content: bytes, key: str) -> Optional[Any]:
+    """
+    从 JSON 响应体中提取单个顶层字段，避免构建完整的字典
+
+    Args:
+        content: JSON 响应体
+        key: 字段名
+
+    Returns:
+        字段值，字段不存在或响应不是 JSON 对象时返回 None
+    """
+    if simdjson is not None:
+        try:
+            doc = _simdjson_parse(content)
+        except (ValueError, RuntimeError):
+            # 非法 JSON 或 simdjson 无法处理的文档（如超过 64 位的整数）交给常规解析器，
+            # 保证结果与未安装 simdjson 时一致
+            doc = None
+
+        if doc is not None:
+            if not isinstance(doc, simdjson.Object):
+                return None
+            # JSON Pointer 需要转义 "~" 和 "/"
+            pointer = "/" + key.replace("~", "~0").replace("/", "~1")
+            try:
+                value = doc.at_pointer(pointer)
+            except (KeyError, IndexError, TypeError, ValueError):
+                return None
+            # 对象/数组转换为 dict/list，不再引用文档，线程解析器可立即复用
+            if isinstance(value, simdjson.Object):
+                return value.as_dict()
+            if isinstance(value, simdjson.Array):
+                return value.as_list()
+            return value
+
+    try:
+        data = _json_loads(content)
+    except ValueError:
+        return None
+    return data.get(key) if isinstance(data, dict) else None
+
+
+class HTTPError(Exception):
+    """HTTP 请求失败（状态码 >= 400）时抛出的异常"""
+
+    def __init__(self, status: int, body: str):
         """
-        初始化 HttpClient 配置
+        初始化 HTTP 异常
 
         Args:
-            header: 请求头字典
-            cookie: Cookie 字典
-            proxy_address: 代理地址 (格式: "host:port")
-            socket_timeout: socket 超时时间（毫秒）
-            connect_timeout: 连接超时时间（毫秒）
-            ignore_ssl: 是否忽略 SSL 证书验证
-        """
-        self.header = header or {}
-        self.cookie = cookie or {}
-        self.proxy_address = proxy_address
-        self.socket_timeout = socket_timeout
-        self.connect_timeout = connect_timeout
-        self.ignore_ssl = ignore_ssl
-
-        # 默认超时设置（单位：秒）
-        self.default_socket_timeout = 60  # 60秒
-        self.default_connect_timeout = 60  # 60秒
-        self.connection_request_timeout = 5  # 5秒
+            status: 状态码
+            body: 响应文本（可能已截断）
+        """
+        self.status = status
+        self.body = body
+        super().__init__(f"HTTP {status}: {body}")
+
+
+@dataclass(frozen=True, slots=True)
+class HttpClientOption:
+    """
+    HTTP 客户端配置选项（不可变）
+
+    Args:
+        header: 请求头字典
+        cookie: Cookie 字典
+        proxy_address: 代理地址 (格式: "host:port")，构造时即校验
+        socket_timeout: socket 超时时间（毫秒）
+        connect_timeout: 连接超时时间（毫秒）
+        ignore_ssl: 是否忽略 SSL 证书验证
+        pool_connections: 连接池缓存的主机数
+        pool_maxsize: 每个主机保持的最大连接数
+
+    Note:
+        httpx 没有按主机的连接数限制，AsyncHttpClient 中 pool_maxsize 对应
+        max_keepalive_connections，max_connections 取 pool_connections * pool_maxsize
+        （即同步客户端所有主机连接数之和的上限）
+    """
+
+    header: Optional[Dict[str, Any]] = None
+    cookie: Optional[Dict[str, Any]] = None
+    proxy_address: Optional[str] = None
+    socket_timeout: Optional[int] = None
+    connect_timeout: Optional[int] = None
+    ignore_ssl: bool = True
+    pool_connections: int = POOL_CONNECTIONS
+    pool_maxsize: int = POOL_MAXSIZE
+
+    # 默认超时设置（单位：秒）
+    default_socket_timeout: int = field(default=60, init=False)  # 60秒
+    default_connect_timeout: int = field(default=60, init=False)  # 60秒
+    connection_request_timeout: int = field(default=5, init=False)  # 5秒
+
+    # 由 proxy_address 解析出的代理配置
+    proxies: Optional[Dict[str, str]] = field(default=None, init=False)
+
+    def __post_init__(self):
+        """规范化配置并预先解析代理地址"""
+        # frozen 数据类需通过 object.__setattr__ 赋值
+        object.__setattr__(self, 'header', self.header or {})
+        object.__setattr__(self, 'cookie', self.cookie or {})
+
+        proxy_url = _parse_proxy(self.proxy_address)
+        if proxy_url:
+            object.__setattr__(self, 'proxies', {
+                'http': proxy_url,
+                'https': proxy_url
+            })
 
 
 class IgnoreSSLAdapter(HTTPAdapter):
-    """忽略 SSL 证书验证的适配器"""
+    """
+    忽略 SSL 证书验证的适配器
+
+    连接池参数（pool_connections、pool_maxsize、max_retries）
+    与 HTTPAdapter 相同，直接透传给父类
+    """
 
     def init_poolmanager(self, *args, **kwargs):
         ctx = create_urllib3_context()
@@ -55,38 +284,199 @@ class IgnoreSSLAdapter(HTTPAdapter):
         return super().init_poolmanager(*args, **kwargs)
 
 
+# 进程内共享的连接池适配器，按 (是否忽略 SSL, 主机数, 每主机连接数) 区分
+_SHARED_ADAPTERS: Dict[tuple, HTTPAdapter] = {}
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
+
+def _shared_adapter(ignore_ssl: bool,
+                    pool_connections: int = POOL_CONNECTIONS,
+                    pool_maxsize: int = POOL_MAXSIZE) -> HTTPAdapter:
+    """
+    获取共享的连接池适配器，使指向同一主机的多个客户端复用 keep-alive 连接
+
+    Args:
+        ignore_ssl: 是否忽略 SSL 证书验证
+        pool_connections: 连接池缓存的主机数
+        pool_maxsize: 每个主机保持的最大连接数
+
+    Returns:
+        HTTPAdapter 对象
+    """
+    key = (ignore_ssl, pool_connections, pool_maxsize)
+    with _SHARED_ADAPTERS_LOCK:
+        adapter = _SHARED_ADAPTERS.get(key)
+        if adapter is None:
+            adapter_class = IgnoreSSLAdapter if ignore_ssl else HTTPAdapter
+            adapter = adapter_class(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=MAX_RETRIES
+            )
+            _SHARED_ADAPTERS[key] = adapter
+        return adapter
+
+
+def _to_option(option: Optional[Union[Dict[str, Any], HttpClientOption]]) -> HttpClientOption:
+    """将字典形式的配置转换为 HttpClientOption 对象"""
+    if option is None:
+        option = {}
+
+    if isinstance(option, dict):
+        return HttpClientOption(
+            header=option.get('header'),
+            cookie=option.get('cookie'),
+            proxy_address=option.get('proxy_address'),
+            socket_timeout=option.get('socket_timeout'),
+            connect_timeout=option.get('connect_timeout'),
+            ignore_ssl=option.get('ignore_ssl', True),
+            pool_connections=option.get('pool_connections', POOL_CONNECTIONS),
+            pool_maxsize=option.get('pool_maxsize', POOL_MAXSIZE)
+        )
+    return option
+
+
+def _parse_proxy(proxy_address: Optional[str]) -> Optional[str]:
+    """
+    解析代理地址
+
+    Args:
+        proxy_address: 代理地址 (格式: "host:port")
+
+    Returns:
+        代理URL，未配置代理时返回 None
+    """
+    if not proxy_address:
+        return None
+
+    proxy_parts = proxy_address.split(':')
+    if len(proxy_parts) != 2:
+        raise ValueError("请输入正确的proxyAddress地址 (格式: host:port)")
+
+    proxy_host = proxy_parts[0]
+    proxy_port = int(proxy_parts[1])
+    return f'http://{proxy_host}:{proxy_port}'
+
+
+def _build_timeout(option: HttpClientOption) -> tuple:
+    """构建超时配置 (连接超时, 读取超时)，单位：秒"""
+    connect_timeout = (
+        option.connect_timeout / 1000
+        if option.connect_timeout
+        else option.default_connect_timeout
+    )
+
+    read_timeout = (
+        option.socket_timeout / 1000
+        if option.socket_timeout
+        else option.default_socket_timeout
+    )
+
+    return (connect_timeout, read_timeout)
+
+
 class HTTPResponse:
-    """HTTP 响应封装类"""
+    """
+    HTTP 响应封装类
 
-    def __init__(self, request_method: str, request_url: str,
-                 status_code: int, headers: Dict[str, str],
-                 content: bytes, elapsed_time: float):
+    持有底层的 requests.Response（或 httpx.Response），
+    各属性按需转发，不复制响应体与响应头
+    """
+
+    def __init__(self, raw: Any, elapsed_time: float):
         """
         初始化 HTTP 响应
 
         Args:
-            request_method: 请求方法
-            request_url: 请求URL
-            status_code: 状态码
-            headers: 响应头
-            content: 响应内容
+            raw: 底层响应对象（requests.Response 或 httpx.Response）
             elapsed_time: 请求耗时（毫秒）
         """
-        self.request_method = request_method
-        self.request_url = request_url
-        self.status_code = status_code
-        self.headers = headers
-        self.content = content
+        self._raw = raw
         self.elapsed_time = elapsed_time
 
     @property
+    def request_method(self) -> str:
+        """请求方法"""
+        return self._raw.request.method
+
+    @property
+    def request_url(self) -> str:
+        """请求URL"""
+        return str(self._raw.request.url)
+
+    @property
+    def status_code(self) -> int:
+        """状态码"""
+        return self._raw.status_code
+
+    @property
+    def headers(self) -> Any:
+        """响应头（不区分大小写的映射）"""
+        return self._raw.headers
+
+    @property
+    def content(self) -> bytes:
+        """响应内容"""
+        return self._raw.content
+
+    @cached_property
     def text(self) -> str:
-        """获取响应文本"""
+        """获取响应文本（首次访问时解码并缓存）"""
         return self.content.decode('utf-8', errors='ignore')
 
-    def json(self) -> Any:
-        """解析 JSON 响应"""
-        return json.loads(self.text)
+    def raise_for_status(self) -> None:
+        """
+        检查响应状态
+
+        Raises:
+            HTTPError: 状态码 >= 400 时抛出
+        """
+        if self.status_code >= 400:
+            raise HTTPError(self.status_code, self.preview())
+
+    def preview(self, limit: int = ERROR_BODY_LIMIT) -> str:
+        """
+        获取响应文本的前 limit 个字节，用于错误信息，避免解码整个响应体
+
+        Args:
+            limit: 最多解码的字节数
+
+        Returns:
+            截断后的响应文本
+        """
+        return self.content[:limit].decode('utf-8', errors='ignore')
+
+    def json(self, type: Optional[Any] = None, lazy: bool = False) -> Any:
+        """
+        解析 JSON 响应
+
+        Args:
+            type: 目标类型（可选），指定时使用 msgspec 按类型解码
+            lazy: 是否对大响应按需解析（默认关闭）。开启后，安装了 simdjson 且
+                响应体超过 LAZY_JSON_THRESHOLD 时返回 simdjson 的只读代理对象，
+                字段在访问时才物化（可调用 as_dict()/as_list() 转换）；
+                代理对象不是 dict/list，不能直接交给 json.dumps 等函数
+
+        Returns:
+            解析后的数据（超出 64 位范围的整数保持精确，不会转换为浮点数；
+            lazy 模式下 simdjson 无法处理此类整数时同样改用常规解析）
+        """
+        if type is not None:
+            if msgspec is None:
+                raise ImportError("按类型解析 JSON 需要安装 msgspec")
+            return msgspec.json.decode(self.content, type=type)
+
+        if (lazy and simdjson is not None
+                and len(self.content) > LAZY_JSON_THRESHOLD):
+            try:
+                # 返回的文档由调用方持有，使用独立的解析器，避免占用线程共享的解析器
+                return simdjson.Parser().parse(self.content)
+            except (ValueError, RuntimeError):
+                # 非法 JSON 或 simdjson 无法处理的文档（如超过 64 位的整数）交给常规解析器，
+                # 非法 JSON 统一抛出 JSONDecodeError
+                pass
+
+        return _json_loads(self.content)
 
     def __str__(self) -> str:
         return (f"HTTPResponse(status_code={self.status_code}, "
@@ -94,34 +484,56 @@ class HTTPResponse:
                 f"content_length={len(self.content)})")
 
 
+class ResponseDecoderMixin:
+    """响应解析混入类：根据 Content-Type 决定是否解析 JSON"""
+
+    @staticmethod
+    def _decode(response: HTTPResponse) -> Any:
+        """
+        解析响应数据
+
+        Content-Type 声明为 JSON（或未声明）时解析 JSON，解析失败返回文本；
+        其他类型直接返回文本，不再尝试解析
+
+        Args:
+            response: HTTPResponse 对象
+
+        Returns:
+            响应数据
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'json' not in content_type.lower():
+            return response.text
+
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            return response.text
+
+
 class HttpClient:
     """HTTP 客户端类"""
 
-    def __init__(self, option: Optional[Union[Dict[str, Any], HttpClientOption]] = None):
+    def __init__(self, option: Optional[Union[Dict[str, Any], HttpClientOption]] = None,
+                 session: Optional[requests.Session] = None):
         """
         初始化 HTTP 客户端
 
         Args:
             option: 配置选项，可以是字典或 HttpClientOption 对象
+            session: 外部会话（可选）。传入时会应用 option 中的请求头、
+                Cookie、代理等设置，但不会挂载连接池，也不会被 close() 关闭
         """
-        if option is None:
-            option = {}
-
         # 转换配置选项
-        if isinstance(option, dict):
-            self.option = HttpClientOption(
-                header=option.get('header'),
-                cookie=option.get('cookie'),
-                proxy_address=option.get('proxy_address'),
-                socket_timeout=option.get('socket_timeout'),
-                connect_timeout=option.get('connect_timeout'),
-                ignore_ssl=option.get('ignore_ssl', True)
-            )
-        else:
-            self.option = option
+        self.option = _to_option(option)
 
-        # 创建会话
-        self.session = requests.Session()
+        # 超时配置在构造时计算一次，各请求直接复用
+        self._timeout = self._build_timeout()
+
+        # 创建会话：每个客户端持有独立的会话（请求头、Cookie 互不影响），
+        # 连接池则在进程内共享
+        self._owns_session = session is None
+        self.session = requests.Session() if session is None else session
 
         # 设置默认请求头
         if self.option.header:
@@ -135,51 +547,25 @@ class HttpClient:
                 self.session.cookies.set(key, str(value))
 
         # 设置代理
-        if self.option.proxy_address:
-            proxy_parts = self.option.proxy_address.split(':')
-            if len(proxy_parts) != 2:
-                raise ValueError("请输入正确的proxyAddress地址 (格式: host:port)")
-
-            proxy_host = proxy_parts[0]
-            proxy_port = int(proxy_parts[1])
-            self.session.proxies = {
-                'http': f'http://{proxy_host}:{proxy_port}',
-                'https': f'http://{proxy_host}:{proxy_port}'
-            }
+        if self.option.proxies:
+            self.session.proxies = dict(self.option.proxies)
 
         # 设置 SSL 验证
         self.session.verify = not self.option.ignore_ssl
 
-        # 添加忽略 SSL 的适配器
-        if self.option.ignore_ssl:
-            adapter = IgnoreSSLAdapter()
+        # 挂载共享连接池（忽略 SSL 时使用 IgnoreSSLAdapter，每个协议只挂载一次）
+        if self._owns_session:
+            adapter = _shared_adapter(
+                self.option.ignore_ssl,
+                self.option.pool_connections,
+                self.option.pool_maxsize
+            )
             self.session.mount('https://', adapter)
             self.session.mount('http://', adapter)
 
-        # 设置连接池
-        adapter = HTTPAdapter(
-            pool_connections=200,
-            pool_maxsize=20,
-            max_retries=3
-        )
-        self.session.mount('https://', adapter)
-        self.session.mount('http://', adapter)
-
     def _build_timeout(self) -> tuple:
         """构建超时配置"""
-        connect_timeout = (
-            self.option.connect_timeout / 1000
-            if self.option.connect_timeout
-            else self.option.default_connect_timeout
-        )
-
-        read_timeout = (
-            self.option.socket_timeout / 1000
-            if self.option.socket_timeout
-            else self.option.default_socket_timeout
-        )
-
-        return (connect_timeout, read_timeout)
+        return _build_timeout(self.option)
 
     def _build_response(self, response: requests.Response,
                         start_time: float) -> HTTPResponse:
@@ -187,11 +573,7 @@ class HttpClient:
         elapsed_time = (time.time() - start_time) * 1000  # 转换为毫秒
 
         return HTTPResponse(
-            request_method=response.request.method,
-            request_url=response.request.url,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            content=response.content,
+            raw=response,
             elapsed_time=elapsed_time
         )
 
@@ -207,7 +589,7 @@ class HttpClient:
             HTTPResponse 对象
         """
         start_time = time.time()
-        timeout = self._build_timeout()
+        timeout = self._timeout
 
         response = self.session.get(
             url,
@@ -224,29 +606,36 @@ class HttpClient:
 
         Args:
             url: 请求URL
-            data: 请求数据（可以是字典或 JSON 字符串）
+            data: 请求数据（可以是字典、JSON 字符串或已序列化的字节串）
             headers: 请求头
 
         Returns:
             HTTPResponse 对象
         """
-        start_time = time.time()
-        timeout = self._build_timeout()
+        return self.post_json_raw(url, _json_body(data), headers=headers)
 
-        # 准备请求头
-        request_headers = {'Content-Type': 'application/json; charset=utf-8'}
-        if headers:
-            request_headers.update(headers)
+    def post_json_raw(self, url: str, body: bytes,
+                      headers: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        POST JSON 请求（请求体已序列化）
 
-        # 准备请求数据
-        if isinstance(data, str):
-            json_data = data
-        else:
-            json_data = json.dumps(data, ensure_ascii=False)
+        Args:
+            url: 请求URL
+            body: 已序列化的 JSON 请求体（UTF-8 字节串），原样发送
+            headers: 请求头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        start_time = time.time()
+        timeout = self._timeout
+
+        # 准备请求头（仅在调用方传入请求头时才构建新字典）
+        request_headers = {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
 
         response = self.session.post(
             url,
-            data=json_data,
+            data=body,
             headers=request_headers,
             timeout=timeout
         )
@@ -267,14 +656,10 @@ class HttpClient:
             HTTPResponse 对象
         """
         start_time = time.time()
-        timeout = self._build_timeout()
+        timeout = self._timeout
 
-        # 准备请求头
-        request_headers = {
-            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
-        }
-        if headers:
-            request_headers.update(headers)
+        # 准备请求头（仅在调用方传入请求头时才构建新字典）
+        request_headers = {**FORM_HEADERS, **headers} if headers else FORM_HEADERS
 
         response = self.session.post(
             url,
@@ -291,31 +676,144 @@ class HttpClient:
 
         Args:
             url: 请求URL
-            data: 请求数据（可以是字典或 JSON 字符串）
+            data: 请求数据（可以是字典、JSON 字符串或已序列化的字节串）
 
         Returns:
             HTTPResponse 对象
         """
         start_time = time.time()
-        timeout = self._build_timeout()
+        timeout = self._timeout
 
         # 准备请求数据
-        if isinstance(data, str):
-            json_data = data
-        else:
-            json_data = json.dumps(data, ensure_ascii=False)
+        json_data = _json_body(data)
 
         # 使用 requests 的 request 方法发送带请求体的 GET 请求
         response = self.session.request(
             'GET',
             url,
             data=json_data,
-            headers={'Content-Type': 'application/json; charset=utf-8'},
+            headers=JSON_HEADERS,
             timeout=timeout
         )
 
         return self._build_response(response, start_time)
 
+    @contextmanager
+    def get_stream(self, url: str,
+                   headers: Optional[Dict[str, Any]] = None) -> Iterator[requests.Response]:
+        """
+        流式 GET 请求，响应体不会预先全部读入内存
+
+        Args:
+            url: 请求URL
+            headers: 请求头
+
+        Yields:
+            响应体尚未读取的 requests.Response 对象，退出上下文时自动关闭
+        """
+        response = self.session.get(
+            url,
+            headers=headers,
+            timeout=self._timeout,
+            stream=True
+        )
+
+        try:
+            # 由 urllib3 负责解码 gzip/deflate 等内容编码
+            response.raw.decode_content = True
+            yield response
+        finally:
+            response.close()
+
+    def get_stream_json(self, url: str, prefix: str = '',
+                        headers: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        流式 GET JSON 请求，边接收边解析
+
+        Args:
+            url: 请求URL
+            prefix: ijson 前缀，'' 表示整个文档，'item' 表示顶层数组的每个元素
+            headers: 请求头
+
+        Yields:
+            与前缀匹配的 JSON 数据
+
+        Raises:
+            ImportError: 未安装 ijson 时抛出
+            HTTPError: 请求失败时抛出
+        """
+        if ijson is None:
+            raise ImportError("流式解析 JSON 需要安装 ijson")
+
+        with self.get_stream(url, headers=headers) as response:
+            self._check_stream_status(response)
+            yield from ijson.items(response.raw, prefix, use_float=True)
+
+    def get_stream_items(self, url: str, item_prefix: str = 'item',
+                         remainder: Optional[Dict[str, Any]] = None,
+                         headers: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        流式 GET JSON 请求，逐条产出记录，不物化整个数组
+
+        适用于“大数组 + 少量分页信息”形式的响应，只需一次解析即可同时
+        获得记录与分页信息
+
+        Args:
+            url: 请求URL
+            item_prefix: 记录的 ijson 前缀，如 'item'（顶层数组）或 'items.item'
+            remainder: 可选字典，用于收集顶层的标量字段（如分页游标），
+                迭代结束后内容完整
+            headers: 请求头
+
+        Yields:
+            与前缀匹配的记录
+
+        Raises:
+            ImportError: 未安装 ijson 时抛出
+            HTTPError: 请求失败时抛出
+        """
+        if ijson is None:
+            raise ImportError("流式解析 JSON 需要安装 ijson")
+
+        with self.get_stream(url, headers=headers) as response:
+            self._check_stream_status(response)
+
+            builder = None
+            depth = 0
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    # 正在构建一条记录，直到其对应的容器闭合
+                    builder.event(event, value)
+                    if event in ('start_map', 'start_array'):
+                        depth += 1
+                    elif event in ('end_map', 'end_array'):
+                        depth -= 1
+                        if depth == 0:
+                            yield builder.value
+                            builder = None
+                elif prefix == item_prefix:
+                    if event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                        depth = 1
+                    else:
+                        yield value
+                elif (remainder is not None and prefix and '.' not in prefix
+                        and event in _SCALAR_EVENTS):
+                    remainder[prefix] = value
+
+    @staticmethod
+    def _check_stream_status(response: requests.Response) -> None:
+        """
+        检查流式响应的状态，错误信息只读取响应体开头部分
+
+        Raises:
+            HTTPError: 状态码 >= 400 时抛出
+        """
+        if response.status_code >= 400:
+            preview = response.raw.read(ERROR_BODY_LIMIT).decode('utf-8', errors='ignore')
+            raise HTTPError(response.status_code, preview)
+
     def upload_files(self, url: str, files: List[Any]) -> HTTPResponse:
         """
         上传文件
@@ -328,7 +826,7 @@ class HttpClient:
             HTTPResponse 对象
         """
         start_time = time.time()
-        timeout = self._build_timeout()
+        timeout = self._timeout
 
         # 准备文件字典
         files_dict = {}
@@ -351,7 +849,10 @@ class HttpClient:
 
     def close(self) -> None:
         """关闭 HTTP 客户端"""
-        if self.session:
+        if self.session and self._owns_session:
+            # 共享连接池不随单个客户端关闭
+            self.session.adapters.pop('https://', None)
+            self.session.adapters.pop('http://', None)
             self.session.close()
 
     def __enter__(self):
@@ -363,3 +864,148 @@ class HttpClient:
         self.close()
 
 
+class AsyncHttpClient:
+    """
+    异步 HTTP 客户端类（基于 httpx.AsyncClient）
+
+    使用持久化的连接池；安装了 h2 时启用 HTTP/2，
+    并发请求可在同一连接上多路复用
+    """
+
+    def __init__(self, option: Optional[Union[Dict[str, Any], HttpClientOption]] = None):
+        """
+        初始化异步 HTTP 客户端
+
+        Args:
+            option: 配置选项，可以是字典或 HttpClientOption 对象
+
+        Raises:
+            ImportError: 未安装 httpx 时抛出
+        """
+        if httpx is None:
+            raise ImportError("AsyncHttpClient 需要安装 httpx")
+
+        # 转换配置选项
+        self.option = _to_option(option)
+
+        connect_timeout, read_timeout = _build_timeout(self.option)
+
+        self.session = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            verify=not self.option.ignore_ssl,
+            proxy=self.option.proxies['https'] if self.option.proxies else None,
+            headers={k: str(v) for k, v in self.option.header.items()},
+            cookies={k: str(v) for k, v in self.option.cookie.items()},
+            # 连接池参数与同步客户端的对应关系见 HttpClientOption
+            limits=httpx.Limits(
+                max_connections=self.option.pool_connections * self.option.pool_maxsize,
+                max_keepalive_connections=self.option.pool_maxsize
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+
+    def _build_response(self, response: Any, start_time: float) -> HTTPResponse:
+        """构建 HTTPResponse 对象"""
+        elapsed_time = (time.time() - start_time) * 1000  # 转换为毫秒
+
+        return HTTPResponse(
+            raw=response,
+            elapsed_time=elapsed_time
+        )
+
+    async def get(self, url: str, headers: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        GET 请求
+
+        Args:
+            url: 请求URL
+            headers: 请求头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        start_time = time.time()
+        response = await self.session.get(url, headers=headers)
+        return self._build_response(response, start_time)
+
+    async def post_json(self, url: str, data: Any,
+                        headers: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        POST JSON 请求
+
+        Args:
+            url: 请求URL
+            data: 请求数据（可以是字典、JSON 字符串或已序列化的字节串）
+            headers: 请求头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        return await self.post_json_raw(url, _json_body(data), headers=headers)
+
+    async def post_json_raw(self, url: str, body: bytes,
+                            headers: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        POST JSON 请求（请求体已序列化）
+
+        Args:
+            url: 请求URL
+            body: 已序列化的 JSON 请求体（UTF-8 字节串），原样发送
+            headers: 请求头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        start_time = time.time()
+
+        # 准备请求头（仅在调用方传入请求头时才构建新字典）
+        request_headers = {**JSON_HEADERS, **headers} if headers else JSON_HEADERS
+
+        response = await self.session.post(
+            url,
+            content=body,
+            headers=request_headers
+        )
+
+        return self._build_response(response, start_time)
+
+    async def post_form(self, url: str, data: Dict[str, Any],
+                        headers: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        """
+        POST 表单请求
+
+        Args:
+            url: 请求URL
+            data: 表单数据
+            headers: 请求头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        start_time = time.time()
+
+        # 准备请求头（仅在调用方传入请求头时才构建新字典）
+        request_headers = {**FORM_HEADERS, **headers} if headers else FORM_HEADERS
+
+        response = await self.session.post(
+            url,
+            data=data,
+            headers=request_headers
+        )
+
+        return self._build_response(response, start_time)
+
+    async def close(self) -> None:
+        """关闭异步 HTTP 客户端"""
+        if self.session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出"""
+        await self.close()
+
+
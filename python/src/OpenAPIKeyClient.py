@@ -1,17 +1,79 @@
 # OpenAPIKeyClient.py
-import json
 import hashlib
-import hmac
+import os
+import ssl
+import threading
 import time
-import uuid
-from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+import warnings
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
 
 # 导入之前翻译的 HttpClient
-from HttpClient import HttpClient, HttpClientOption
+from HttpClient import (AsyncHttpClient, HttpClient, HttpClientOption, ResponseDecoderMixin,
+                        _join, _json_dumps)
 
+# HMAC 内外层填充的异或转换表
+_TRANS_36 = bytes((x ^ 0x36) for x in range(256))
+_TRANS_5C = bytes((x ^ 0x5C) for x in range(256))
+_SHA256_BLOCK_SIZE = 64
 
-class OpenAPIKeyClient:
+# 签名前缀（method + path + apiKey）哈希状态缓存的最大条目数
+SIGN_PREFIX_CACHE_SIZE = 256
+
+# hashlib 由 OpenSSL 实现，1.1.1 之前的版本未针对 SHA 指令集扩展（SHA-NI / ARMv8）优化
+if ssl.OPENSSL_VERSION_INFO < (1, 1, 1):
+    warnings.warn(
+        f"当前 Python 链接的 {ssl.OPENSSL_VERSION} 低于 1.1.1，"
+        "签名计算无法使用 SHA 指令集加速，建议升级 OpenSSL",
+        RuntimeWarning
+    )
+
+
+def _nonce() -> str:
+    """生成随机数（Nonce）：16 个随机字节的十六进制字符串"""
+    return os.urandom(16).hex()
+
+
+def _hmac_sha256_pads(key: bytes) -> Tuple[Any, Any]:
+    """
+    预先计算 HMAC-SHA256 已写入内外层填充密钥的哈希状态
+
+    Args:
+        key: 签名密钥
+
+    Returns:
+        (内层哈希状态, 外层哈希状态)
+    """
+    if len(key) > _SHA256_BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(_SHA256_BLOCK_SIZE, b'\0')
+    return (hashlib.sha256(key.translate(_TRANS_36)),
+            hashlib.sha256(key.translate(_TRANS_5C)))
+
+
+def _hmac_sha256_hex(inner: Any, outer: Any, msg: bytes) -> str:
+    """
+    基于预先计算的密钥状态生成 HMAC-SHA256 签名
+
+    复制哈希状态只是内存拷贝，省去了每次请求重新处理密钥的开销
+
+    Args:
+        inner: 内层哈希状态
+        outer: 外层哈希状态
+        msg: 待签名的数据
+
+    Returns:
+        十六进制签名字符串
+    """
+    inner = inner.copy()
+    inner.update(msg)
+    outer = outer.copy()
+    outer.update(inner.digest())
+    return outer.hexdigest()
+
+
+class OpenAPIKeyClient(ResponseDecoderMixin):
     """OpenAPI 密钥认证客户端"""
 
     def __init__(self, base_url: str, api_key: str, api_secret: str):
@@ -25,63 +87,64 @@ class OpenAPIKeyClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self._api_key_bytes = api_key.encode('utf-8')
+        # 预先计算 HMAC 的内外层密钥状态，签名时只需复制
+        self._inner, self._outer = _hmac_sha256_pads(api_secret.encode('utf-8'))
+        # 最近一次的时间戳及其字符串形式，同一时刻的请求直接复用
+        self._ts_cache = (0, "")
+        # 认证头中固定不变的部分，每次请求复制后再补充时间戳、随机数与签名
+        self._header_template = {
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json"
+        }
         self.base_url = base_url.rstrip('/') + '/'  # 确保以斜杠结尾
 
         # 创建 HTTP 客户端
         option = HttpClientOption(header={})
         self.client = HttpClient(option)
 
-    def _generate_signature(self, text: str) -> str:
+    def _generate_signature(self, *parts: bytes) -> str:
         """
         生成 HMAC-SHA256 签名
 
         Args:
-            text: 待签名的文本
+            parts: 待签名的各部分数据（UTF-8 字节串），按顺序拼接
 
         Returns:
             十六进制签名字符串
         """
-        try:
-            # 创建 HMAC-SHA256 签名
-            signature = hmac.new(
-                self.api_secret.encode('utf-8'),
-                text.encode('utf-8'),
-                hashlib.sha256
-            )
-
-            # 返回十六进制字符串
-            return signature.hexdigest()
-        except Exception as e:
-            raise RuntimeError(f"签名生成失败: {str(e)}")
+        return _hmac_sha256_hex(self._inner, self._outer, b''.join(parts))
 
-    def _build_auth_headers(self, request_body: str = "") -> Dict[str, str]:
+    def _build_auth_headers(self, request_body: bytes = b"") -> Dict[str, str]:
         """
         构建认证请求头
 
         Args:
-            request_body: 请求体内容
+            request_body: 已序列化的请求体
 
         Returns:
             认证头字典
         """
-        headers = {}
-
-        # 时间戳（毫秒）
-        timestamp = str(int(time.time() * 1000))
+        # 时间戳（毫秒），同一毫秒内复用已格式化的字符串
+        ts = int(time.time() * 1000)
+        cached_ts, timestamp = self._ts_cache
+        if ts != cached_ts:
+            timestamp = str(ts)
+            self._ts_cache = (ts, timestamp)
 
         # 随机数（Nonce）
-        nonce = str(uuid.uuid4()).replace("-", "")
+        nonce = _nonce()
 
         # 签名计算：apiKey + timestamp + nonce + body
-        sign_text = self.api_key + timestamp + nonce + request_body
-        signature = self._generate_signature(sign_text)
+        signature = self._generate_signature(
+            self._api_key_bytes, timestamp.encode('ascii'), nonce.encode('ascii'), request_body
+        )
 
         # 添加认证头
-        headers["X-Api-Key"] = self.api_key
+        headers = self._header_template.copy()
         headers["X-Timestamp"] = timestamp
         headers["X-Nonce"] = nonce
         headers["X-Signature"] = signature
-        headers["Content-Type"] = "application/json"
 
         return headers
 
@@ -97,27 +160,23 @@ class OpenAPIKeyClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = _join(self.base_url, url)
 
-        # GET 请求的 body 为空字符串
-        request_body = ""
+        # GET 请求的 body 为空
+        request_body = b""
         auth_headers = self._build_auth_headers(request_body)
 
         # 发送 GET 请求
         response = self.client.get(full_url, headers=auth_headers)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def post(self, url: str, data: Dict[str, Any]) -> Any:
         """
@@ -131,27 +190,23 @@ class OpenAPIKeyClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = _join(self.base_url, url)
 
-        # 将数据转换为 JSON 字符串作为请求 body
-        request_body = json.dumps(data, ensure_ascii=False)
+        # 将数据序列化为 JSON 作为请求 body，签名与发送使用同一份结果
+        request_body = _json_dumps(data)
         auth_headers = self._build_auth_headers(request_body)
 
         # 发送 POST JSON 请求
-        response = self.client.post_json(full_url, data, headers=auth_headers)
+        response = self.client.post_json_raw(full_url, request_body, headers=auth_headers)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def post_form(self, url: str, data: Dict[str, Any]) -> Any:
         """
@@ -165,27 +220,23 @@ class OpenAPIKeyClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = _join(self.base_url, url)
 
         # 将数据转换为 JSON 字符串作为请求 body（签名需要）
-        request_body = json.dumps(data, ensure_ascii=False)
+        request_body = _json_dumps(data)
         auth_headers = self._build_auth_headers(request_body)
 
         # 发送 POST 表单请求
         response = self.client.post_form(full_url, data, headers=auth_headers)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def close(self) -> None:
         """关闭连接"""
@@ -201,10 +252,15 @@ class OpenAPIKeyClient:
         self.close()
 
 
-class OpenAPIKeyClientV2:
+class OpenAPIKeyClientV2(ResponseDecoderMixin):
     """
     OpenAPI 密钥认证客户端（增强版）
     支持更多认证方式和配置选项
+
+    Note:
+        异步客户端绑定创建时的事件循环。在 async with 块内调用 arequest 时，
+        多个请求共享块内创建的连接池，退出时自动关闭；
+        在块外调用时，每次调用使用独立的异步客户端并在返回前关闭
     """
 
     def __init__(self,
@@ -227,8 +283,26 @@ class OpenAPIKeyClientV2:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self._api_key_bytes = api_key.encode('utf-8')
+        # 预先计算 HMAC 的内外层密钥状态，签名时只需复制
+        self._inner, self._outer = _hmac_sha256_pads(api_secret.encode('utf-8'))
+        # 最近一次的时间戳及其字符串形式，同一时刻的请求直接复用
+        self._ts_cache = (0, "")
+        # 认证头中固定不变的部分，每次请求复制后再补充时间戳、随机数与签名
+        self._header_template = {
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json"
+        }
+        # (method, path) -> 已写入签名前缀的内层哈希状态（LRU）
+        self._prefix_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._prefix_lock = threading.Lock()
         self.base_url = base_url.rstrip('/') + '/'
 
+        # 预先拆分基础URL，请求时通过字符串拼接构建完整URL与签名路径
+        base_parts = urlsplit(self.base_url)
+        self._base_prefix = f"{base_parts.scheme}://{base_parts.netloc}"
+        self._base_path = base_parts.path
+
         # 创建 HTTP 客户端配置
         headers = {
             "User-Agent": "OpenAPI-Python-Client/1.0",
@@ -243,14 +317,74 @@ class OpenAPIKeyClientV2:
             proxy_address=proxy
         )
 
+        self._option = option
         self.client = HttpClient(option)
+        # 异步客户端（仅在 async with 块内存在）
+        self._async_client: Optional[AsyncHttpClient] = None
+
+        # HTTP 方法 -> (发送函数, 是否携带请求体)
+        # 注意：HttpClient 类没有实现 PUT/DELETE 方法，这里分别简化为 POST/GET
+        self._dispatch = {
+            "GET": (self.client.get, False),
+            "POST": (self.client.post_json_raw, True),
+            "PUT": (self.client.post_json_raw, True),
+            "DELETE": (self.client.get, False)
+        }
+
+    def _split_url(self, url: str) -> Tuple[str, str]:
+        """
+        构建完整URL与签名路径
+
+        Args:
+            url: 相对URL路径（也可以是绝对URL）
+
+        Returns:
+            (完整URL, 签名路径)，签名路径包含查询参数，不包含域名
+        """
+        if url.startswith(('http://', 'https://')):
+            parts = urlsplit(url)
+            path = parts.path + ("?" + parts.query if parts.query else "")
+            return url, path
+
+        path = self._base_path + url.lstrip('/')
+        return self._base_prefix + path, path
+
+    def _prefix_state(self, method: str, path: str) -> Any:
+        """
+        获取已写入签名前缀（method + path + apiKey）的内层哈希状态
+
+        同一接口的重复请求直接复用缓存的状态，只需再处理时间戳、随机数与请求体摘要。
+        返回的状态不可原地修改，使用方需先复制
+
+        Args:
+            method: HTTP 方法（大写）
+            path: 请求路径（不包含域名）
+
+        Returns:
+            内层哈希状态
+        """
+        key = (method, path)
+        with self._prefix_lock:
+            state = self._prefix_cache.get(key)
+            if state is not None:
+                self._prefix_cache.move_to_end(key)
+                return state
+
+        state = self._inner.copy()
+        state.update(method.encode('ascii') + path.encode('utf-8') + self._api_key_bytes)
+
+        with self._prefix_lock:
+            self._prefix_cache[key] = state
+            if len(self._prefix_cache) > SIGN_PREFIX_CACHE_SIZE:
+                self._prefix_cache.popitem(last=False)
+        return state
 
     def _generate_signature_v2(self,
                                method: str,
                                path: str,
                                timestamp: str,
                                nonce: str,
-                               body: str = "") -> str:
+                               body_hash: str = "") -> str:
         """
         生成增强版签名
 
@@ -259,61 +393,91 @@ class OpenAPIKeyClientV2:
             path: 请求路径（不包含域名）
             timestamp: 时间戳
             nonce: 随机数
-            body: 请求体
+            body_hash: 请求体的 SHA256 十六进制摘要（无请求体时为空字符串）
 
         Returns:
             十六进制签名字符串
         """
         # 签名算法：method + path + apiKey + timestamp + nonce + bodyHash
-        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest() if body else ""
+        # 前缀部分的哈希状态按 (method, path) 缓存
+        prefix = self._prefix_state(method.upper(), path)
 
-        # 构建签名字符串
-        sign_text = f"{method.upper()}{path}{self.api_key}{timestamp}{nonce}{body_hash}"
+        # 构建剩余签名数据（各部分一次性拼接）
+        sign_text = b''.join((
+            timestamp.encode('ascii'),
+            nonce.encode('ascii'),
+            body_hash.encode('ascii')
+        ))
 
         # 生成 HMAC-SHA256 签名
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            sign_text.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-
-        return signature
+        return _hmac_sha256_hex(prefix, self._outer, sign_text)
 
     def _build_auth_headers_v2(self,
                                method: str,
                                path: str,
-                               body: str = "") -> Dict[str, str]:
+                               body_hash: str = "") -> Dict[str, str]:
         """
         构建增强版认证请求头
 
         Args:
             method: HTTP 方法
             path: 请求路径
-            body: 请求体内容
+            body_hash: 请求体的 SHA256 十六进制摘要
 
         Returns:
             认证头字典
         """
-        headers = {}
-
-        # 时间戳（秒，整数）
-        timestamp = str(int(time.time()))
+        # 时间戳（秒，整数），同一秒内复用已格式化的字符串
+        ts = int(time.time())
+        cached_ts, timestamp = self._ts_cache
+        if ts != cached_ts:
+            timestamp = str(ts)
+            self._ts_cache = (ts, timestamp)
 
         # 随机数（Nonce）
-        nonce = str(uuid.uuid4()).replace("-", "")
+        nonce = _nonce()
 
         # 生成签名
-        signature = self._generate_signature_v2(method, path, timestamp, nonce, body)
+        signature = self._generate_signature_v2(method, path, timestamp, nonce, body_hash)
 
         # 添加认证头
-        headers["X-Api-Key"] = self.api_key
+        headers = self._header_template.copy()
         headers["X-Timestamp"] = timestamp
         headers["X-Nonce"] = nonce
         headers["X-Signature"] = signature
-        headers["Content-Type"] = "application/json"
 
         return headers
 
+    def _sign_request(self,
+                      method: str,
+                      url: str,
+                      data: Optional[Dict[str, Any]]) -> Tuple[str, bytes, Dict[str, str]]:
+        """
+        准备签名请求：构建完整URL、序列化请求体并生成认证头
+
+        Args:
+            method: HTTP 方法（大写）
+            url: 相对URL路径
+            data: 请求体数据
+
+        Returns:
+            (完整URL, 已序列化的请求体, 认证头字典)
+        """
+        # 构建完整URL，并提取路径部分（用于签名）
+        full_url, path = self._split_url(url)
+
+        # 准备请求体（签名与发送使用同一份序列化结果），摘要只计算一次
+        request_body = b""
+        body_hash = ""
+        if data is not None:
+            request_body = _json_dumps(data)
+            body_hash = hashlib.sha256(request_body).hexdigest()
+
+        # 构建认证头
+        auth_headers = self._build_auth_headers_v2(method, path, body_hash)
+
+        return full_url, request_body, auth_headers
+
     def request(self,
                 method: str,
                 url: str,
@@ -332,56 +496,111 @@ class OpenAPIKeyClientV2:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
-        # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
-
-        # 提取路径部分（用于签名）
-        parsed_url = urlparse(full_url)
-        path = parsed_url.path
-        if parsed_url.query:
-            path += "?" + parsed_url.query
-
-        # 准备请求体
-        request_body = ""
-        if data is not None:
-            request_body = json.dumps(data, ensure_ascii=False)
+        method = method.upper()
+        send, with_body = self._dispatch.get(method, (None, False))
+        if send is None:
+            raise ValueError(f"不支持的 HTTP 方法: {method}")
 
-        # 构建认证头
-        auth_headers = self._build_auth_headers_v2(method, path, request_body)
+        full_url, request_body, auth_headers = self._sign_request(method, url, data)
 
         # 根据方法发送请求
-        if method.upper() == "GET":
-            response = self.client.get(full_url, headers=auth_headers)
-        elif method.upper() == "POST":
-            response = self.client.post_json(full_url, data, headers=auth_headers)
-        elif method.upper() == "PUT":
-            # 注意：HttpClient 类没有实现 PUT 方法，这里简化为 POST
-            # 在实际应用中，可能需要扩展 HttpClient 类
-            response = self.client.post_json(full_url, data, headers=auth_headers)
-        elif method.upper() == "DELETE":
-            # 注意：HttpClient 类没有实现 DELETE 方法
-            # 在实际应用中，可能需要扩展 HttpClient 类
-            response = self.client.get(full_url, headers=auth_headers)
+        if with_body:
+            response = send(full_url, request_body, headers=auth_headers)
         else:
+            response = send(full_url, headers=auth_headers)
+
+        # 检查响应状态
+        response.raise_for_status()
+
+        # 解析响应数据
+        return self._decode(response)
+
+    @staticmethod
+    async def _asend(client: AsyncHttpClient,
+                     with_body: bool,
+                     full_url: str,
+                     request_body: bytes,
+                     auth_headers: Dict[str, str]) -> Any:
+        """
+        通过异步客户端发送已签名的请求
+
+        与同步版相同：PUT 简化为 POST，DELETE 简化为 GET
+
+        Args:
+            client: 异步 HTTP 客户端
+            with_body: 是否携带请求体
+            full_url: 完整URL
+            request_body: 已序列化的请求体
+            auth_headers: 认证头
+
+        Returns:
+            HTTPResponse 对象
+        """
+        if with_body:
+            return await client.post_json_raw(full_url, request_body, headers=auth_headers)
+        return await client.get(full_url, headers=auth_headers)
+
+    async def arequest(self,
+                       method: str,
+                       url: str,
+                       data: Optional[Dict[str, Any]] = None,
+                       params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        发送通用请求（带签名认证，异步版）
+
+        多个请求可在同一异步连接池上并发执行
+
+        Args:
+            method: HTTP 方法（GET, POST, PUT, DELETE等）
+            url: 相对URL路径
+            data: 请求体数据
+            params: 查询参数
+
+        Returns:
+            响应数据
+
+        Raises:
+            HTTPError: 请求失败时抛出
+            ImportError: 未安装 httpx 时抛出
+        """
+        method = method.upper()
+        if method not in self._dispatch:
             raise ValueError(f"不支持的 HTTP 方法: {method}")
+        with_body = self._dispatch[method][1]
+
+        full_url, request_body, auth_headers = self._sign_request(method, url, data)
+
+        if self._async_client is not None:
+            response = await self._asend(
+                self._async_client, with_body, full_url, request_body, auth_headers
+            )
+        else:
+            # 不在 async with 块内：使用本次调用独占的异步客户端，返回前关闭
+            async with AsyncHttpClient(self._option) as client:
+                response = await self._asend(
+                    client, with_body, full_url, request_body, auth_headers
+                )
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def close(self) -> None:
         """关闭连接"""
         if self.client:
             self.client.close()
 
+    async def aclose(self) -> None:
+        """关闭连接（包括异步客户端）"""
+        self.close()
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.close()
+
     def __enter__(self):
         """上下文管理器入口"""
         return self
@@ -390,4 +609,14 @@ class OpenAPIKeyClientV2:
         """上下文管理器退出"""
         self.close()
 
+    async def __aenter__(self):
+        """异步上下文管理器入口：创建块内共享的异步客户端"""
+        if self._async_client is None:
+            self._async_client = AsyncHttpClient(self._option)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出"""
+        await self.aclose()
+
 
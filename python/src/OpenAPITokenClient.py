@@ -1,13 +1,80 @@
 # OpenAPITokenClient.py
-import json
-from typing import Dict, Any, Optional, Union
-from urllib.parse import urljoin
+import asyncio
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, List, Optional
 
 # 导入之前翻译的 HttpClient
-from HttpClient import HttpClient, HttpClientOption
+from HttpClient import (AsyncHttpClient, HttpClient, HttpClientOption,
+                        ResponseDecoderMixin, _join, _json_dumps, extract_field)
 
 
-class OpenAPITokenClient:
+# 方法重写头（只读，多个请求共享）
+_PUT_OVERRIDE = MappingProxyType({"X-HTTP-Method-Override": "PUT"})
+_DELETE_OVERRIDE = MappingProxyType({"X-HTTP-Method-Override": "DELETE"})
+
+
+def _do_get(client: HttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 GET 请求"""
+    return client.get(url)
+
+
+def _do_post(client: HttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 POST JSON 请求"""
+    return client.post_json(url, data or {})
+
+
+def _do_put(client: HttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 PUT 请求（POST 并添加方法重写头）"""
+    return client.post_json(url, data or {}, headers=_PUT_OVERRIDE)
+
+
+def _do_delete(client: HttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 DELETE 请求（GET 并添加方法重写头）"""
+    return client.get(url, headers=_DELETE_OVERRIDE)
+
+
+# HTTP 方法到请求函数的映射
+_METHOD_DISPATCH = {
+    "GET": _do_get,
+    "POST": _do_post,
+    "PUT": _do_put,
+    "DELETE": _do_delete
+}
+
+
+async def _ado_get(client: AsyncHttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 GET 请求（异步）"""
+    return await client.get(url)
+
+
+async def _ado_post(client: AsyncHttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 POST JSON 请求（异步）"""
+    return await client.post_json(url, data or {})
+
+
+async def _ado_put(client: AsyncHttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 PUT 请求（异步，POST 并添加方法重写头）"""
+    return await client.post_json(url, data or {}, headers=_PUT_OVERRIDE)
+
+
+async def _ado_delete(client: AsyncHttpClient, url: str, data: Optional[Dict[str, Any]]) -> Any:
+    """发送 DELETE 请求（异步，GET 并添加方法重写头）"""
+    return await client.get(url, headers=_DELETE_OVERRIDE)
+
+
+# HTTP 方法到异步请求函数的映射
+_ASYNC_METHOD_DISPATCH = {
+    "GET": _ado_get,
+    "POST": _ado_post,
+    "PUT": _ado_put,
+    "DELETE": _ado_delete
+}
+
+
+class OpenAPITokenClient(ResponseDecoderMixin):
     """OpenAPI Token 认证客户端"""
 
     def __init__(self, base_url: str, token: str):
@@ -26,6 +93,18 @@ class OpenAPITokenClient:
         option = HttpClientOption(header=headers)
         self.client = HttpClient(option)
 
+    def _full_url(self, url: str) -> str:
+        """
+        构建完整URL
+
+        Args:
+            url: 相对URL路径
+
+        Returns:
+            完整URL
+        """
+        return _join(self.base_url, url)
+
     def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         发送 GET 请求
@@ -38,23 +117,44 @@ class OpenAPITokenClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
         # 发送 GET 请求
         response = self.client.get(full_url)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
+
+    def get_items(self,
+                  url: str,
+                  item_prefix: str = 'item',
+                  remainder: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """
+        流式获取分页接口返回的记录，逐条产出，不物化整个列表
+
+        Args:
+            url: 相对URL路径
+            item_prefix: 记录的 ijson 前缀，如 'item'（顶层数组）或 'items.item'
+            remainder: 可选字典，用于收集顶层的标量字段（如分页游标），
+                迭代结束后内容完整
+
+        Returns:
+            记录迭代器
+
+        Raises:
+            ImportError: 未安装 ijson 时抛出
+            HTTPError: 请求失败时抛出
+        """
+        # 构建完整URL
+        full_url = self._full_url(url)
+
+        return self.client.get_stream_items(full_url, item_prefix, remainder)
 
     def post(self, url: str, data: Dict[str, Any]) -> Any:
         """
@@ -68,23 +168,19 @@ class OpenAPITokenClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
         # 发送 POST JSON 请求
         response = self.client.post_json(full_url, data)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def post_form(self, url: str, data: Dict[str, Any]) -> Any:
         """
@@ -98,23 +194,19 @@ class OpenAPITokenClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
         # 发送 POST 表单请求
         response = self.client.post_form(full_url, data)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def put(self, url: str, data: Dict[str, Any]) -> Any:
         """
@@ -128,30 +220,23 @@ class OpenAPITokenClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
 
         Note:
             由于 HttpClient 没有直接实现 PUT 方法，
             这里使用 POST 并添加 X-HTTP-Method-Override 头
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
-        # 添加方法重写头
-        headers = {"X-HTTP-Method-Override": "PUT"}
-
-        # 发送请求
-        response = self.client.post_json(full_url, data, headers=headers)
+        # 发送请求（添加方法重写头）
+        response = self.client.post_json(full_url, data, headers=_PUT_OVERRIDE)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def delete(self, url: str) -> Any:
         """
@@ -164,24 +249,19 @@ class OpenAPITokenClient:
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
         # 发送 GET 请求（添加 DELETE 指示）
-        headers = {"X-HTTP-Method-Override": "DELETE"}
-        response = self.client.get(full_url, headers=headers)
+        response = self.client.get(full_url, headers=_DELETE_OVERRIDE)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def close(self) -> None:
         """关闭连接"""
@@ -248,6 +328,23 @@ class OpenAPITokenClientV2(OpenAPITokenClient):
 
         self.client = HttpClient(option)
 
+        # 预先构建各认证类型的请求头
+        self._auth_headers = self._build_auth_type_headers()
+
+    def _build_auth_type_headers(self) -> Dict[str, Dict[str, str]]:
+        """
+        构建各认证类型对应的请求头（令牌变化时重新构建）
+
+        Returns:
+            认证类型到请求头的映射
+        """
+        encoded_token = base64.b64encode(self.token.encode()).decode()
+        return {
+            "token": {"token": self.token},
+            "bearer": {"Authorization": f"Bearer {self.token}"},
+            "basic": {"Authorization": f"Basic {encoded_token}"}
+        }
+
     def refresh_token(self, new_token: str) -> None:
         """
         刷新认证令牌
@@ -260,6 +357,7 @@ class OpenAPITokenClientV2(OpenAPITokenClient):
         # 更新认证头
         auth_header_value = self.auth_header_format.format(new_token)
         self.client.session.headers[self.auth_header_name] = auth_header_value
+        self._auth_headers = self._build_auth_type_headers()
 
     def get_with_auth_type(self,
                            url: str,
@@ -275,34 +373,22 @@ class OpenAPITokenClientV2(OpenAPITokenClient):
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
-        """
-        # 根据认证类型设置不同的头
-        if auth_type == "bearer":
-            headers = {"Authorization": f"Bearer {self.token}"}
-        elif auth_type == "basic":
-            # Base64 编码 token
-            import base64
-            encoded_token = base64.b64encode(self.token.encode()).decode()
-            headers = {"Authorization": f"Basic {encoded_token}"}
-        else:  # 默认使用 token
-            headers = {"token": self.token}
+            HTTPError: 请求失败时抛出
+        """
+        # 根据认证类型选择预先构建的请求头，未知类型默认使用 token
+        headers = self._auth_headers.get(auth_type, self._auth_headers["token"])
 
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
+        full_url = self._full_url(url)
 
         # 发送 GET 请求
         response = self.client.get(full_url, headers=headers)
 
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
 
     def request(self,
                 method: str,
@@ -322,36 +408,226 @@ class OpenAPITokenClientV2(OpenAPITokenClient):
             响应数据
 
         Raises:
-            Exception: 请求失败时抛出
+            HTTPError: 请求失败时抛出
         """
         # 构建完整URL
-        full_url = urljoin(self.base_url, url.lstrip('/'))
-
-        # 根据方法发送请求
-        if method.upper() == "GET":
-            response = self.client.get(full_url)
-        elif method.upper() == "POST":
-            response = self.client.post_json(full_url, data or {})
-        elif method.upper() == "PUT":
-            # 添加方法重写头
-            headers = {"X-HTTP-Method-Override": "PUT"}
-            response = self.client.post_json(full_url, data or {}, headers=headers)
-        elif method.upper() == "DELETE":
-            # 添加方法重写头
-            headers = {"X-HTTP-Method-Override": "DELETE"}
-            response = self.client.get(full_url, headers=headers)
-        else:
+        full_url = self._full_url(url)
+
+        # 根据方法查找请求函数
+        handler = _METHOD_DISPATCH.get(method.upper())
+        if handler is None:
             raise ValueError(f"不支持的 HTTP 方法: {method}")
 
+        # 发送请求
+        response = handler(self.client, full_url, data)
+
         # 检查响应状态
-        if response.status_code >= 400:
-            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        response.raise_for_status()
 
-        # 尝试解析 JSON 响应
-        try:
-            return response.json()
-        except json.JSONDecodeError:
-            return response.text
+        # 解析响应数据
+        return self._decode(response)
+
+
+class AsyncOpenAPITokenClient(ResponseDecoderMixin):
+    """
+    OpenAPI Token 认证客户端（异步版）
+    基于 AsyncHttpClient，多个请求可在同一连接池上并发执行
+
+    Note:
+        底层 httpx.AsyncClient 绑定创建连接时的事件循环，
+        请在同一个事件循环中使用并关闭该客户端
+    """
+
+    def __init__(self,
+                 base_url: str,
+                 token: str,
+                 timeout: Optional[int] = 30,
+                 verify_ssl: bool = True,
+                 proxy: Optional[str] = None,
+                 auth_header_name: str = "Authorization",
+                 auth_header_format: str = "Bearer {}"):
+        """
+        初始化 OpenAPI Token 客户端（异步版）
+
+        Args:
+            base_url: API 基础URL
+            token: 认证令牌
+            timeout: 超时时间（秒）
+            verify_ssl: 是否验证 SSL 证书
+            proxy: 代理地址（格式: "host:port"）
+            auth_header_name: 认证头名称
+            auth_header_format: 认证头格式
+        """
+        self.token = token
+        self.base_url = base_url.rstrip('/') + '/'
+        self.auth_header_name = auth_header_name
+        self.auth_header_format = auth_header_format
+
+        # 创建 HTTP 客户端配置
+        headers = {
+            auth_header_name: auth_header_format.format(token),
+            "User-Agent": "OpenAPI-Token-Client/1.0",
+            "Accept": "application/json"
+        }
+
+        option = HttpClientOption(
+            header=headers,
+            socket_timeout=timeout * 1000 if timeout else None,
+            connect_timeout=timeout * 1000 if timeout else None,
+            ignore_ssl=not verify_ssl,
+            proxy_address=proxy
+        )
+
+        self.client = AsyncHttpClient(option)
+
+    def _full_url(self, url: str) -> str:
+        """
+        构建完整URL
+
+        Args:
+            url: 相对URL路径
+
+        Returns:
+            完整URL
+        """
+        return _join(self.base_url, url)
+
+    def refresh_token(self, new_token: str) -> None:
+        """
+        刷新认证令牌
+
+        Args:
+            new_token: 新的认证令牌
+        """
+        self.token = new_token
+
+        # 更新认证头
+        auth_header_value = self.auth_header_format.format(new_token)
+        self.client.session.headers[self.auth_header_name] = auth_header_value
+
+    async def get(self, url: str) -> Any:
+        """
+        发送 GET 请求
+
+        Args:
+            url: 相对URL路径
+
+        Returns:
+            响应数据
+        """
+        return await self.request("GET", url)
+
+    async def post(self, url: str, data: Dict[str, Any]) -> Any:
+        """
+        发送 POST 请求
+
+        Args:
+            url: 相对URL路径
+            data: 请求数据
+
+        Returns:
+            响应数据
+        """
+        return await self.request("POST", url, data)
+
+    async def put(self, url: str, data: Dict[str, Any]) -> Any:
+        """
+        发送 PUT 请求（使用 POST 并添加 X-HTTP-Method-Override 头）
+
+        Args:
+            url: 相对URL路径
+            data: 请求数据
+
+        Returns:
+            响应数据
+        """
+        return await self.request("PUT", url, data)
+
+    async def delete(self, url: str) -> Any:
+        """
+        发送 DELETE 请求（使用 GET 并添加 X-HTTP-Method-Override 头）
+
+        Args:
+            url: 相对URL路径
+
+        Returns:
+            响应数据
+        """
+        return await self.request("DELETE", url)
+
+    async def post_form(self, url: str, data: Dict[str, Any]) -> Any:
+        """
+        发送 POST 表单请求
+
+        Args:
+            url: 相对URL路径
+            data: 表单数据
+
+        Returns:
+            响应数据
+
+        Raises:
+            HTTPError: 请求失败时抛出
+        """
+        response = await self.client.post_form(self._full_url(url), data)
+
+        # 检查响应状态
+        response.raise_for_status()
+
+        # 解析响应数据
+        return self._decode(response)
+
+    async def request(self,
+                      method: str,
+                      url: str,
+                      data: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        发送通用请求
+
+        Args:
+            method: HTTP 方法（GET, POST, PUT, DELETE）
+            url: 相对URL路径
+            data: 请求体数据
+
+        Returns:
+            响应数据
+
+        Raises:
+            HTTPError: 请求失败时抛出
+        """
+        # 构建完整URL
+        full_url = self._full_url(url)
+
+        # 根据方法查找请求函数
+        handler = _ASYNC_METHOD_DISPATCH.get(method.upper())
+        if handler is None:
+            raise ValueError(f"不支持的 HTTP 方法: {method}")
+
+        # 发送请求
+        response = await handler(self.client, full_url, data)
+
+        # 检查响应状态
+        response.raise_for_status()
+
+        # 解析响应数据
+        return self._decode(response)
+
+    async def close(self) -> None:
+        """关闭连接"""
+        if self.client:
+            await self.client.close()
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器退出"""
+        await self.close()
+
+
+# TokenManager 批量请求线程池的最大线程数
+BATCH_MAX_WORKERS = 32
 
 
 class TokenManager:
@@ -377,6 +653,9 @@ class TokenManager:
         self.refresh_interval = refresh_interval
         self.last_refresh_time = 0
 
+        # 刷新请求体只依赖当前令牌，预先序列化，令牌变化时更新
+        self._refresh_body = _json_dumps({"token": token})
+
         # 创建客户端
         self.client = OpenAPITokenClientV2(
             base_url=base_url,
@@ -385,6 +664,9 @@ class TokenManager:
             auth_header_format="Bearer {}"
         )
 
+        # 批量请求使用的线程池（复用线程，避免每个请求新建线程）
+        self._pool = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS)
+
     def should_refresh(self) -> bool:
         """检查是否应该刷新令牌"""
         current_time = time.time()
@@ -402,15 +684,18 @@ class TokenManager:
             return False
 
         try:
-            # 调用刷新接口
-            response = self.client.post(self.refresh_url, {
-                "token": self.current_token
-            })
-
-            # 假设响应中包含新令牌
-            if isinstance(response, dict) and "access_token" in response:
-                new_token = response["access_token"]
+            # 调用刷新接口，直接使用原始响应，避免解析整个响应体
+            full_url = self.client._full_url(self.refresh_url)
+            response = self.client.client.post_json(full_url, self._refresh_body)
+
+            # 检查响应状态
+            response.raise_for_status()
+
+            # 假设响应中包含新令牌，只提取 access_token 字段
+            new_token = extract_field(response.content, "access_token")
+            if new_token is not None:
                 self.current_token = new_token
+                self._refresh_body = _json_dumps({"token": new_token})
                 self.client.refresh_token(new_token)
                 self.last_refresh_time = time.time()
                 return True
@@ -453,7 +738,50 @@ class TokenManager:
 
         return self.client.post(url, data)
 
+    def get_many(self, urls: List[str], auto_refresh: bool = True) -> List[Any]:
+        """
+        通过线程池并发发送多个 GET 请求
+
+        Args:
+            urls: 相对URL路径列表
+            auto_refresh: 是否自动刷新令牌
+
+        Returns:
+            与 urls 顺序一致的响应数据列表
+        """
+        # 统一在分发前刷新一次令牌，避免多个线程同时刷新
+        if auto_refresh and self.should_refresh():
+            self.refresh()
+
+        return list(self._pool.map(lambda url: self.get(url, auto_refresh=False), urls))
+
+    async def aget_many(self, urls: List[str], auto_refresh: bool = True) -> List[Any]:
+        """
+        并发发送多个 GET 请求（共享同一异步连接池）
+
+        Args:
+            urls: 相对URL路径列表
+            auto_refresh: 是否自动刷新令牌
+
+        Returns:
+            与 urls 顺序一致的响应数据列表
+        """
+        if auto_refresh and self.should_refresh():
+            # 刷新接口为同步调用，放到线程中执行以免阻塞事件循环
+            await asyncio.to_thread(self.refresh)
+
+        # 异步客户端绑定当前事件循环，只在本次调用内使用并在返回前关闭，
+        # 同一批请求共享一个连接池
+        async with AsyncOpenAPITokenClient(
+            base_url=self.base_url,
+            token=self.current_token,
+            auth_header_name="Authorization",
+            auth_header_format="Bearer {}"
+        ) as client:
+            return await asyncio.gather(*[client.get(url) for url in urls])
+
     def close(self) -> None:
         """关闭连接"""
+        self._pool.shutdown()
         self.client.close()
 
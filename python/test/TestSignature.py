@@ -0,0 +1,76 @@
+import hashlib
+import hmac
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from OpenAPIKeyClient import (OpenAPIKeyClient, OpenAPIKeyClientV2,
+                              _hmac_sha256_hex, _hmac_sha256_pads)
+
+API_KEY = "test-key"
+API_SECRET = "test-secret"
+
+
+class TestSignature(unittest.TestCase):
+    """签名计算与标准库 hmac 的一致性测试"""
+
+    def test_pads_match_hmac(self):
+        # 覆盖空密钥、短密钥、恰好一个分组、超过一个分组（需先哈希）的密钥
+        for key_len in (0, 1, 64, 65, 200):
+            key = bytes(i % 256 for i in range(key_len))
+            inner, outer = _hmac_sha256_pads(key)
+            for msg in (b'', b'abc', b'x' * 1000):
+                with self.subTest(key_len=key_len, msg_len=len(msg)):
+                    self.assertEqual(
+                        _hmac_sha256_hex(inner, outer, msg),
+                        hmac.new(key, msg, hashlib.sha256).hexdigest()
+                    )
+
+    def test_v1_signature_matches_baseline(self):
+        client = OpenAPIKeyClient("http://localhost/api", API_KEY, API_SECRET)
+        try:
+            timestamp, nonce, body = "1700000000000", "0123456789abcdef", '{"a":"中"}'
+            expected = hmac.new(
+                API_SECRET.encode('utf-8'),
+                (API_KEY + timestamp + nonce + body).encode('utf-8'),
+                hashlib.sha256
+            ).hexdigest()
+            actual = client._generate_signature(
+                client._api_key_bytes, timestamp.encode('ascii'),
+                nonce.encode('ascii'), body.encode('utf-8')
+            )
+            self.assertEqual(actual, expected)
+        finally:
+            client.close()
+
+    def test_v2_signature_matches_baseline(self):
+        client = OpenAPIKeyClientV2("http://localhost/api", API_KEY, API_SECRET)
+        try:
+            timestamp, nonce = "1700000000", "0123456789abcdef"
+            cases = [
+                ("get", "/api/items?page=1", b""),
+                ("POST", "/api/数据", '{"a":1}'.encode('utf-8')),
+            ]
+            # 每个用例计算两次，第二次命中签名前缀缓存
+            for _ in range(2):
+                for method, path, body in cases:
+                    with self.subTest(method=method, path=path):
+                        body_hash = hashlib.sha256(body).hexdigest() if body else ""
+                        sign_text = f"{method.upper()}{path}{API_KEY}{timestamp}{nonce}{body_hash}"
+                        expected = hmac.new(
+                            API_SECRET.encode('utf-8'),
+                            sign_text.encode('utf-8'),
+                            hashlib.sha256
+                        ).hexdigest()
+                        self.assertEqual(
+                            client._generate_signature_v2(method, path, timestamp, nonce, body_hash),
+                            expected
+                        )
+        finally:
+            client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()